@@ -19,16 +19,15 @@ class BulkTransactionMixin:
     Mixin that provides transaction management for bulk operations.
     """
 
-    @contextlib.contextmanager
     def maybe_atomic(self):
         """
-        Context manager that conditionally wraps operations in a transaction.
-        Set use_bulk_transactions=False on the view to disable transactions.
+        Return a context manager that conditionally wraps operations in a
+        transaction. Set use_bulk_transactions=False on the view to
+        disable transactions.
         """
-        use_tx = getattr(self, "use_bulk_transactions", True)
-        ctx = transaction.atomic() if use_tx else contextlib.nullcontext()
-        with ctx:
-            yield
+        if getattr(self, "use_bulk_transactions", True):
+            return transaction.atomic()
+        return contextlib.nullcontext()
 
 
 class BulkCreateModelMixin(BulkTransactionMixin, CreateModelMixin):
@@ -48,6 +47,11 @@ class BulkCreateModelMixin(BulkTransactionMixin, CreateModelMixin):
         if not bulk:
             return super(BulkCreateModelMixin, self).create(request, *args, **kwargs)
 
+        elif not request.data:
+            # Nothing to validate or save; skip serializer setup and the
+            # transaction round trip entirely
+            return Response([], status=status.HTTP_201_CREATED)
+
         else:
             serializer = self.get_serializer(data=request.data, many=True)
             serializer.is_valid(raise_exception=True)
@@ -84,6 +88,11 @@ class BulkUpdateModelMixin(BulkTransactionMixin, object):
     def bulk_update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", False)
 
+        # Nothing to validate or save; skip serializer setup and the
+        # transaction round trip entirely
+        if isinstance(request.data, list) and not request.data:
+            return Response([], status=status.HTTP_200_OK)
+
         # restrict the update to the filtered queryset
         serializer = self.get_serializer(
             self.filter_queryset(self.get_queryset()),
@@ -110,27 +119,45 @@ class BulkUpdateModelMixin(BulkTransactionMixin, object):
 class BulkDestroyModelMixin(BulkTransactionMixin, object):
     """
     Destroy model instances.
+
+    By default the filtered queryset is deleted with a single
+    ``QuerySet.delete()`` call which issues one ``DELETE ... WHERE``
+    statement instead of one per instance. Cascade deletes still work
+    since Django's ``QuerySet.delete()`` handles them. Set
+    ``bulk_destroy_per_object = True`` to fall back to calling
+    ``perform_destroy()`` per instance, e.g. when relying on a custom
+    ``Model.delete()`` override.
     """
 
+    bulk_destroy_per_object = False
+
     def allow_bulk_destroy(self, base_qs, filtered_qs):
         """
         Hook to ensure that the bulk destroy should be allowed.
 
         By default this checks that the destroy is only applied to
-        filtered querysets. Uses order-insensitive comparison and
-        count-based verification for safety.
+        filtered querysets. The comparison is structural (inspecting the
+        WHERE clause) where possible so SQL is not compiled on every
+        DELETE request; ordering differences are ignored either way.
         """
-        # Normalize ordering to avoid false positives from ORDER BY differences
-        base_norm = base_qs.order_by()
-        filt_norm = filtered_qs.order_by()
+        base_query = base_qs.query
+        filtered_query = filtered_qs.query
+
+        base_restricted = bool(base_query.where) or bool(base_query.extra)
+        filtered_restricted = bool(filtered_query.where) or bool(filtered_query.extra)
 
-        # Fast path: if queries are identical (no filtering), block
-        if str(base_norm.query) == str(filt_norm.query):
+        # Structural fast paths avoid cloning the querysets or invoking
+        # the SQL compiler (the WHERE clause is unaffected by ordering)
+        if not filtered_restricted:
+            # No filtering was applied at all - block
             return False
+        if not base_restricted:
+            # The filtered queryset is restricted while the base is not - allow
+            return True
 
-        # If queries differ, filtering was applied - allow the delete
-        # The query difference check is sufficient to determine filtering occurred
-        return True
+        # Both querysets carry filters; compare compiled SQL to decide,
+        # normalizing ordering only here to avoid ORDER BY false positives
+        return str(base_qs.order_by().query) != str(filtered_qs.order_by().query)
 
     def bulk_destroy(self, request, *args, **kwargs):
         qs = self.get_queryset()
@@ -148,5 +175,8 @@ class BulkDestroyModelMixin(BulkTransactionMixin, object):
 
     def perform_bulk_destroy(self, objects):
         with self.maybe_atomic():
-            for obj in objects:
-                self.perform_destroy(obj)
+            if self.bulk_destroy_per_object:
+                for obj in objects:
+                    self.perform_destroy(obj)
+            else:
+                objects.delete()
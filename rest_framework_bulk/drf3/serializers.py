@@ -1,16 +1,41 @@
 from __future__ import print_function, unicode_literals
 
-import inspect
-from collections import Counter
+import os
+import uuid
 
+from django.db import connections
 from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty
 from rest_framework.serializers import ListSerializer
 
 __all__ = [
+    "BulkCreateListSerializer",
     "BulkListSerializer",
     "BulkSerializerMixin",
 ]
 
+DEFAULT_BULK_BATCH_SIZE = 1000
+
+# Types a lookup value may legitimately have; a positive isinstance check
+# is much cheaper than the inspect.isclass guard it replaces
+_VALID_ID_TYPES = (int, str, bytes, uuid.UUID)
+
+
+def _bulk_batch_size(child):
+    """
+    Batch size used for bulk_create/bulk_update queries.
+
+    Batching bounds per-query parameter count and memory: too small a batch
+    increases round trips, too large risks hitting DB parameter limits
+    (SQLite allows 999 parameters per statement, PostgreSQL 65535).
+    Configure per serializer via ``Meta.bulk_batch_size`` or globally via
+    the ``DRF_BULK_BATCH_SIZE`` environment variable.
+    """
+    batch_size = getattr(child.Meta, "bulk_batch_size", None)
+    if batch_size is None:
+        batch_size = int(os.environ.get("DRF_BULK_BATCH_SIZE", DEFAULT_BULK_BATCH_SIZE))
+    return batch_size
+
 
 class BulkSerializerMixin(object):
     def __init__(self, *args, **kwargs):
@@ -33,58 +58,265 @@ class BulkSerializerMixin(object):
     def to_internal_value(self, data):
         ret = super(BulkSerializerMixin, self).to_internal_value(data)
 
-        id_attr = getattr(self.Meta, "update_lookup_field", "id")
-        request_method = getattr(getattr(self.context.get("view"), "request"), "method", "")
+        root = self.root
 
         # add update_lookup_field field back to validated data
         # since super by default strips out read-only fields
         # hence id will no longer be present in validated_data
-        if isinstance(self.root, BulkListSerializer) and request_method in ("PUT", "PATCH"):
-            # Field existence already validated in __init__ for update operations
-            id_field = self.fields[id_attr]
-            id_value = id_field.get_value(data)
-            ret[id_attr] = id_value
+        if isinstance(root, BulkListSerializer) and root._is_bulk_update:
+            # The list serializer caches the lookup field resolution once
+            # for all child items, including the bound field methods
+            id_attr = root._id_attr
+            get_value = root._id_get_value
+            to_internal_value = root._id_to_internal_value
+            if get_value is None:
+                id_field = self.fields[id_attr]
+                get_value = id_field.get_value
+                to_internal_value = id_field.to_internal_value
+
+            # Coerce the raw value through the field so it compares equal
+            # to the DB-typed keys in_bulk() returns (e.g. "1" -> 1, uuid
+            # strings -> UUID); None and absent values are left alone for
+            # update() to reject with its own error message
+            value = get_value(data)
+            if value is not None and value is not empty:
+                value = to_internal_value(value)
+            ret[id_attr] = value
 
         return ret
 
 
-class BulkListSerializer(ListSerializer):
+class BulkCreateListSerializer(ListSerializer):
+    """
+    List serializer that creates all instances with a single
+    ``bulk_create()`` call instead of one INSERT per item.
+
+    Enable by setting ``Meta.list_serializer_class = BulkCreateListSerializer``
+    on the child serializer. ``BulkListSerializer`` inherits this behavior,
+    so serializers already configured for bulk updates get it for free.
+    """
+
+    # Set to False to fall back to DRF's per-row child.create(), e.g. when
+    # the child serializer's create() has side effects or writes relations.
+    use_bulk_create = True
+
+    def create(self, validated_data):
+        if not self.use_bulk_create:
+            return super(BulkCreateListSerializer, self).create(validated_data)
+
+        model = self.child.Meta.model
+        instances = [model(**item) for item in validated_data]
+        model._default_manager.bulk_create(
+            instances,
+            batch_size=_bulk_batch_size(self.child),
+        )
+        return instances
+
+
+class BulkListSerializer(BulkCreateListSerializer):
     update_lookup_field = "id"
 
-    def update(self, queryset, all_validated_data):
-        id_attr = getattr(self.child.Meta, "update_lookup_field", "id")
+    # When True, updates are applied in memory and persisted with a single
+    # queryset.bulk_update() call instead of one UPDATE per object.
+    # Set to False to fall back to per-row child.update(), e.g. when the
+    # child serializer's update() has side effects or writes relations.
+    use_bulk_update = True
 
-        # Extract and validate IDs in O(n)
-        try:
-            id_list = [item[id_attr] for item in all_validated_data]
-        except KeyError:
-            raise ValidationError(f"Missing required field '{id_attr}' in one or more items.")
+    # How rows are written back when use_bulk_update is enabled:
+    # "auto"/"values" - on PostgreSQL, when all items update the same set
+    #                   of fields, issue a single UPDATE ... FROM (VALUES
+    #                   ...) statement; otherwise behave like "django".
+    #                   Django's bulk_update() builds one CASE WHEN
+    #                   expression per column, which is far more expensive
+    #                   to plan and execute for wide updates.
+    # "django"        - always use queryset.bulk_update()
+    bulk_update_strategy = "auto"
 
-        # O(n) duplicate detection using Counter
-        duplicates = [k for k, v in Counter(id_list).items() if v > 1]
-        if duplicates:
-            raise ValidationError(f"Duplicate {id_attr} values found in request: {duplicates}")
+    def __init__(self, *args, **kwargs):
+        super(BulkListSerializer, self).__init__(*args, **kwargs)
+
+        # Resolve the lookup field once; it is identical for every child
+        # item so per-item getattr/dict lookups would be pure overhead
+        self._id_attr = getattr(
+            getattr(self.child, "Meta", None),
+            "update_lookup_field",
+            self.update_lookup_field,
+        )
+        self._id_field = self.child.fields.get(self._id_attr)
+        # Bind the field methods once as well; children call them per row
+        self._id_get_value = self._id_field.get_value if self._id_field is not None else None
+        self._id_to_internal_value = (
+            self._id_field.to_internal_value if self._id_field is not None else None
+        )
 
-        # Build data map by ID
+        # The request method is loop-invariant for the whole bulk request,
+        # so detect the bulk update case once rather than per child item
+        view = self.context.get("view")
+        request = getattr(view, "request", None)
+        self._is_bulk_update = getattr(request, "method", "") in ("PUT", "PATCH")
+
+    def update(self, queryset, all_validated_data):
+        if not all_validated_data:
+            return []
+
+        id_attr = self._id_attr
+
+        # Extract, validate, de-duplicate and map ids in a single pass.
+        # The lookup value is intentionally left in each item's validated
+        # data and skipped when updates are applied
+        id_list = []
         data_by_id = {}
+        seen = set()
+        duplicates = []
         for item in all_validated_data:
-            key = item.pop(id_attr)
-            if not (bool(key) and not inspect.isclass(key)):
+            try:
+                key = item[id_attr]
+            except KeyError:
+                raise ValidationError(f"Missing required field '{id_attr}' in one or more items.")
+            if not key or not isinstance(key, _VALID_ID_TYPES):
                 raise ValidationError(f"Invalid or missing {id_attr} values: [{key!r}]")
-            data_by_id[key] = item
+            if key in seen:
+                duplicates.append(key)
+            else:
+                seen.add(key)
+                id_list.append(key)
+                data_by_id[key] = item
+
+        if duplicates:
+            raise ValidationError(f"Duplicate {id_attr} values found in request: {duplicates}")
 
-        # Single query using in_bulk; supports non-PK lookup via field_name
-        obj_by_id = queryset.in_bulk(id_list, field_name=id_attr)
+        # Meta.bulk_fetch_only = True restricts the fetch to the lookup
+        # field plus the fields actually being written, which saves moving
+        # every column on wide models. It is opt-in: any serializer field
+        # absent from the payload is deferred, so re-serializing it in the
+        # response costs one query per object. Only enable it when the
+        # payload always covers every field the response renders
+        if getattr(self.child.Meta, "bulk_fetch_only", False):
+            needed_fields = set().union(*(item.keys() for item in all_validated_data))
+            needed_fields.add(id_attr)
+            queryset = queryset.only(*needed_fields)
 
-        # Check for missing objects
-        missing = [i for i in id_list if i not in obj_by_id]
-        if missing:
+        # Single query using in_bulk; supports non-PK lookup via field_name.
+        # The common single-item case skips the in_bulk machinery (which
+        # iterates and builds its own dict) with a direct get()
+        if len(id_list) == 1:
+            try:
+                obj_by_id = {id_list[0]: queryset.get(**{id_attr: id_list[0]})}
+            except queryset.model.DoesNotExist:
+                raise ValidationError(f"Could not find objects with {id_attr} values: {id_list}")
+        else:
+            obj_by_id = queryset.in_bulk(id_list, field_name=id_attr)
+
+        # Check for missing objects; the length comparison is O(1) and the
+        # detailed scan only runs once an error is already guaranteed
+        if len(obj_by_id) != len(id_list):
+            missing = [i for i in id_list if i not in obj_by_id]
             raise ValidationError(f"Could not find objects with {id_attr} values: {missing}")
 
-        # Build response preserving input order
+        # Rebuilding the response in input order costs an extra pass of
+        # dict lookups; callers that do not care about ordering can skip
+        # it with Meta.bulk_preserve_order = False and take the fetched
+        # objects in whatever order the dict already holds them
+        if getattr(self.child.Meta, "bulk_preserve_order", True):
+            try:
+                pairs = [(obj_id, obj_by_id[obj_id]) for obj_id in id_list]
+            except KeyError:
+                # Ids that compare unequal to the DB-typed keys slip past
+                # the length check above; report them as missing instead
+                # of crashing
+                missing = [i for i in id_list if i not in obj_by_id]
+                raise ValidationError(f"Could not find objects with {id_attr} values: {missing}")
+        else:
+            pairs = list(obj_by_id.items())
+
+        if not self.use_bulk_update:
+            return [self.child.update(obj, data_by_id[obj_id]) for obj_id, obj in pairs]
+
+        # Apply changes in memory, then persist everything with a single
+        # bulk_update() call
         updated_objects = []
-        for obj_id in id_list:
-            obj = obj_by_id[obj_id]
-            updated_objects.append(self.child.update(obj, data_by_id[obj_id]))
+        fields = set()
+        for obj_id, obj in pairs:
+            data = data_by_id[obj_id]
+            for attr, value in data.items():
+                if attr != id_attr:
+                    setattr(obj, attr, value)
+            fields.update(data)
+            updated_objects.append(obj)
+
+        fields.discard(id_attr)
+        if fields:
+            fields = list(fields)
+            batch_size = _bulk_batch_size(self.child)
+            if self._use_values_update(queryset, data_by_id, fields):
+                self._bulk_update_values(queryset, updated_objects, fields, id_attr, batch_size)
+            else:
+                queryset.bulk_update(updated_objects, fields=fields, batch_size=batch_size)
 
         return updated_objects
+
+    def _use_values_update(self, queryset, data_by_id, fields):
+        """
+        Whether rows can be written back with a single
+        ``UPDATE ... FROM (VALUES ...)`` statement.
+
+        The VALUES rows need a value for every column, so the strategy only
+        applies when all items update the same set of fields (each item
+        also carries the lookup value, hence the ``+ 1``).
+        """
+        if self.bulk_update_strategy not in ("auto", "values"):
+            return False
+        if connections[queryset.db].vendor != "postgresql":
+            return False
+        return all(len(data) == len(fields) + 1 for data in data_by_id.values())
+
+    def _bulk_update_values(self, queryset, objects, fields, id_attr, batch_size):
+        """
+        Write all rows back with ``UPDATE ... FROM (VALUES ...)`` joined on
+        the lookup column, one statement per batch (PostgreSQL only).
+        """
+        connection = connections[queryset.db]
+        quote = connection.ops.quote_name
+        opts = queryset.model._meta
+
+        id_field = opts.get_field(id_attr)
+        value_fields = [id_field] + [opts.get_field(name) for name in fields]
+
+        table = quote(opts.db_table)
+        id_col = quote(id_field.column)
+        columns = [quote(field.column) for field in value_fields]
+        set_clause = ", ".join(f"{col} = data.{col}" for col in columns[1:])
+
+        # Cast the first VALUES row so PostgreSQL can infer column types
+        # for the whole list; the remaining rows are bare placeholders
+        first_row = "({})".format(
+            ", ".join(f"%s::{field.cast_db_type(connection)}" for field in value_fields)
+        )
+        other_row = "({})".format(", ".join(["%s"] * len(value_fields)))
+
+        # bulk_update() writes through the queryset, so view-level filters
+        # still apply at write time; mirror that guarantee by constraining
+        # the UPDATE to ids the restricted queryset still matches
+        where_clause = ""
+        where_params = []
+        if queryset.query.where:
+            id_query = queryset.values_list(id_field.name, flat=True).query
+            sub_sql, sub_params = id_query.get_compiler(queryset.db).as_sql()
+            where_clause = f" AND {table}.{id_col} IN ({sub_sql})"
+            where_params = list(sub_params)
+
+        with connection.cursor() as cursor:
+            for start in range(0, len(objects), batch_size):
+                batch = objects[start : start + batch_size]
+                values_clause = ", ".join([first_row] + [other_row] * (len(batch) - 1))
+                sql = (
+                    f"UPDATE {table} SET {set_clause} "
+                    f"FROM (VALUES {values_clause}) AS data ({', '.join(columns)}) "
+                    f"WHERE {table}.{id_col} = data.{id_col}{where_clause}"
+                )
+                params = [
+                    field.get_db_prep_save(getattr(obj, field.attname), connection)
+                    for obj in batch
+                    for field in value_fields
+                ]
+                cursor.execute(sql, params + where_params)
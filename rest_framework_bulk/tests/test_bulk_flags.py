@@ -0,0 +1,293 @@
+from __future__ import print_function, unicode_literals
+
+import json
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
+from rest_framework_bulk.serializers import BulkListSerializer
+
+from .simple_app.models import SimpleModel
+from .simple_app.serializers import SimpleSerializer
+from .simple_app.views import FilteredBulkAPIView, SimpleBulkAPIView
+
+
+class PerRowListSerializer(BulkListSerializer):
+    """List serializer opting out of the bulk create/update fast paths."""
+
+    use_bulk_create = False
+    use_bulk_update = False
+
+
+class PerRowSerializer(SimpleSerializer):
+    class Meta(SimpleSerializer.Meta):
+        list_serializer_class = PerRowListSerializer
+
+
+class PerRowView(SimpleBulkAPIView):
+    serializer_class = PerRowSerializer
+
+
+def captured_statements(queries, verb):
+    return [q for q in queries if q["sql"].startswith(verb)]
+
+
+class TestBulkDestroyPerObjectFlag(TestCase):
+    def setUp(self):
+        super(TestBulkDestroyPerObjectFlag, self).setUp()
+        self.request = RequestFactory()
+
+    def test_default_skips_perform_destroy(self):
+        """
+        Test that the default bulk destroy deletes the queryset in one go
+        without calling perform_destroy() per instance.
+        """
+        calls = []
+
+        class TrackedView(FilteredBulkAPIView):
+            def perform_destroy(self, instance):
+                calls.append(instance.pk)
+                super(TrackedView, self).perform_destroy(instance)
+
+        SimpleModel.objects.create(contents="hello world", number=1)
+        SimpleModel.objects.create(contents="hello mars", number=10)
+
+        response = TrackedView.as_view()(self.request.delete("/"))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(calls, [])
+        self.assertEqual(SimpleModel.objects.count(), 1)
+
+    def test_per_object_opt_in(self):
+        """
+        Test that bulk_destroy_per_object = True restores the per-instance
+        perform_destroy() loop.
+        """
+        calls = []
+
+        class PerObjectView(FilteredBulkAPIView):
+            bulk_destroy_per_object = True
+
+            def perform_destroy(self, instance):
+                calls.append(instance.pk)
+                super(PerObjectView, self).perform_destroy(instance)
+
+        SimpleModel.objects.create(contents="hello world", number=1)
+        obj2 = SimpleModel.objects.create(contents="hello mars", number=10)
+        obj3 = SimpleModel.objects.create(contents="hello venus", number=20)
+
+        response = PerObjectView.as_view()(self.request.delete("/"))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(sorted(calls), [obj2.pk, obj3.pk])
+        self.assertEqual(SimpleModel.objects.count(), 1)
+
+
+class TestUseBulkCreateFlag(TestCase):
+    def setUp(self):
+        super(TestUseBulkCreateFlag, self).setUp()
+        self.request = RequestFactory()
+        self.payload = json.dumps(
+            [
+                {"contents": "hello world", "number": 1},
+                {"contents": "hello mars", "number": 2},
+            ]
+        )
+
+    def test_default_single_insert(self):
+        """
+        Test that the default bulk create inserts all rows with one statement.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = SimpleBulkAPIView.as_view()(
+                self.request.post("/", self.payload, content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SimpleModel.objects.count(), 2)
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "INSERT")), 1)
+
+    def test_per_row_fallback(self):
+        """
+        Test that use_bulk_create = False falls back to one insert per row.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = PerRowView.as_view()(
+                self.request.post("/", self.payload, content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SimpleModel.objects.count(), 2)
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "INSERT")), 2)
+
+
+class TestUseBulkUpdateFlag(TestCase):
+    def setUp(self):
+        super(TestUseBulkUpdateFlag, self).setUp()
+        self.request = RequestFactory()
+        self.obj1 = SimpleModel.objects.create(contents="hello world", number=1)
+        self.obj2 = SimpleModel.objects.create(contents="hello mars", number=2)
+        self.payload = json.dumps(
+            [
+                {"contents": "foo", "number": 3, "id": self.obj1.pk},
+                {"contents": "bar", "number": 4, "id": self.obj2.pk},
+            ]
+        )
+
+    def assert_updated(self):
+        self.assertEqual(
+            list(SimpleModel.objects.all().values_list("id", "contents", "number")),
+            [
+                (self.obj1.pk, "foo", 3),
+                (self.obj2.pk, "bar", 4),
+            ],
+        )
+
+    def test_default_single_update(self):
+        """
+        Test that the default bulk update writes all rows with one statement.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = SimpleBulkAPIView.as_view()(
+                self.request.put("/", self.payload, content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_updated()
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "UPDATE")), 1)
+
+    def test_per_row_fallback(self):
+        """
+        Test that use_bulk_update = False falls back to one update per row.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            response = PerRowView.as_view()(
+                self.request.put("/", self.payload, content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_updated()
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "UPDATE")), 2)
+
+
+class TestBulkBatchSize(TestCase):
+    def setUp(self):
+        super(TestBulkBatchSize, self).setUp()
+        self.request = RequestFactory()
+        self.payload = json.dumps(
+            [
+                {"contents": "hello world", "number": 1},
+                {"contents": "hello mars", "number": 2},
+            ]
+        )
+
+    def test_meta_batch_size(self):
+        """
+        Test that Meta.bulk_batch_size bounds rows per statement.
+        """
+
+        class BatchedSerializer(SimpleSerializer):
+            class Meta(SimpleSerializer.Meta):
+                bulk_batch_size = 1
+
+        class BatchedView(SimpleBulkAPIView):
+            serializer_class = BatchedSerializer
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = BatchedView.as_view()(
+                self.request.post("/", self.payload, content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SimpleModel.objects.count(), 2)
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "INSERT")), 2)
+
+    def test_env_override(self):
+        """
+        Test that DRF_BULK_BATCH_SIZE applies when Meta does not set a size.
+        """
+        with mock.patch.dict("os.environ", {"DRF_BULK_BATCH_SIZE": "1"}):
+            with CaptureQueriesContext(connection) as ctx:
+                response = SimpleBulkAPIView.as_view()(
+                    self.request.post("/", self.payload, content_type="application/json")
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SimpleModel.objects.count(), 2)
+        self.assertEqual(len(captured_statements(ctx.captured_queries, "INSERT")), 2)
+
+
+class TestEmptyPayloadShortCircuit(TestCase):
+    def setUp(self):
+        super(TestEmptyPayloadShortCircuit, self).setUp()
+        self.view = SimpleBulkAPIView.as_view()
+        self.request = RequestFactory()
+
+    def test_post_empty_list(self):
+        """
+        Test that POST of an empty list returns immediately without queries.
+        """
+        with self.assertNumQueries(0):
+            response = self.view(
+                self.request.post("/", json.dumps([]), content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, [])
+
+    def test_put_empty_list(self):
+        """
+        Test that PUT of an empty list returns immediately without queries.
+        """
+        with self.assertNumQueries(0):
+            response = self.view(
+                self.request.put("/", json.dumps([]), content_type="application/json")
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+
+
+class TestPreserveOrderFlag(TestCase):
+    def test_preserve_order_opt_out(self):
+        """
+        Test that bulk update with Meta.bulk_preserve_order = False still
+        updates and returns every submitted resource.
+        """
+
+        class UnorderedSerializer(SimpleSerializer):
+            class Meta(SimpleSerializer.Meta):
+                bulk_preserve_order = False
+
+        class UnorderedView(SimpleBulkAPIView):
+            serializer_class = UnorderedSerializer
+
+        obj1 = SimpleModel.objects.create(contents="hello world", number=1)
+        obj2 = SimpleModel.objects.create(contents="hello mars", number=2)
+
+        response = UnorderedView.as_view()(
+            RequestFactory().put(
+                "/",
+                json.dumps(
+                    [
+                        {"contents": "bar", "number": 4, "id": obj2.pk},
+                        {"contents": "foo", "number": 3, "id": obj1.pk},
+                    ]
+                ),
+                content_type="application/json",
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(item["id"] for item in response.data), [obj1.pk, obj2.pk])
+        self.assertEqual(
+            list(SimpleModel.objects.all().values_list("id", "contents", "number")),
+            [
+                (obj1.pk, "foo", 3),
+                (obj2.pk, "bar", 4),
+            ],
+        )
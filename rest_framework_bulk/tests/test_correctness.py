@@ -2,11 +2,14 @@ from __future__ import print_function, unicode_literals
 
 import json
 
+from django.db import connection
 from django.test import TestCase, TransactionTestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 
 from .simple_app.models import SimpleModel
+from .simple_app.serializers import SimpleSerializer
 from .simple_app.views import FilteredBulkAPIView, SimpleBulkAPIView
 
 
@@ -110,6 +113,59 @@ class TestBulkUpdateCorrectness(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_put_with_string_ids(self):
+        """
+        Test that ids sent as JSON strings are coerced through the lookup
+        field and match the fetched objects, for single and multi item
+        payloads alike.
+        """
+        obj1 = SimpleModel.objects.create(contents="hello world", number=1)
+        obj2 = SimpleModel.objects.create(contents="hello mars", number=2)
+
+        response = self.view(
+            self.request.put(
+                "/",
+                json.dumps(
+                    [
+                        {"contents": "foo", "number": 3, "id": str(obj1.pk)},
+                        {"contents": "bar", "number": 4, "id": str(obj2.pk)},
+                    ]
+                ),
+                content_type="application/json",
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(SimpleModel.objects.all().values_list("id", "contents", "number")),
+            [
+                (obj1.pk, "foo", 3),
+                (obj2.pk, "bar", 4),
+            ],
+        )
+
+    def test_put_with_unparseable_string_id(self):
+        """
+        Test that an id which cannot be coerced by the lookup field is
+        rejected with a validation error instead of a server error.
+        """
+        obj1 = SimpleModel.objects.create(contents="hello world", number=1)
+
+        response = self.view(
+            self.request.put(
+                "/",
+                json.dumps(
+                    [
+                        {"contents": "foo", "number": 3, "id": obj1.pk},
+                        {"contents": "bar", "number": 4, "id": "not-a-number"},
+                    ]
+                ),
+                content_type="application/json",
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_preserved_update_order(self):
         """
         Test that bulk update preserves the order of the input.
@@ -146,6 +202,77 @@ class TestBulkUpdateCorrectness(TestCase):
         self.assertEqual(response_data[2]["contents"], "updated_second")
 
 
+class TestBulkFetchOnly(TestCase):
+    def setUp(self):
+        super(TestBulkFetchOnly, self).setUp()
+        self.view = SimpleBulkAPIView.as_view()
+        self.request = RequestFactory()
+
+    def test_patch_does_not_defer_response_fields(self):
+        """
+        Test that a partial update does not defer the fields missing from
+        the payload, which would cost one query per object when the
+        response is rendered (bulk_fetch_only is opt-in for this reason).
+        """
+        SimpleModel.objects.create(contents="hello world", number=1)
+        SimpleModel.objects.create(contents="hello mars", number=2)
+
+        ids = list(SimpleModel.objects.values_list("id", flat=True))
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.view(
+                self.request.patch(
+                    "/",
+                    json.dumps([{"number": 10, "id": ids[0]}, {"number": 20, "id": ids[1]}]),
+                    content_type="application/json",
+                )
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        selects = [q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        # One fetch for the whole batch; no per-object reloads of
+        # "contents" while rendering the response
+        self.assertEqual(len(selects), 1)
+
+    def test_opt_in_fetch_only(self):
+        """
+        Test that bulk update still works with Meta.bulk_fetch_only = True
+        when the payload covers every rendered field.
+        """
+
+        class FetchOnlySerializer(SimpleSerializer):
+            class Meta(SimpleSerializer.Meta):
+                bulk_fetch_only = True
+
+        class FetchOnlyView(SimpleBulkAPIView):
+            serializer_class = FetchOnlySerializer
+
+        obj1 = SimpleModel.objects.create(contents="hello world", number=1)
+        obj2 = SimpleModel.objects.create(contents="hello mars", number=2)
+
+        response = FetchOnlyView.as_view()(
+            self.request.put(
+                "/",
+                json.dumps(
+                    [
+                        {"contents": "foo", "number": 3, "id": obj1.pk},
+                        {"contents": "bar", "number": 4, "id": obj2.pk},
+                    ]
+                ),
+                content_type="application/json",
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(SimpleModel.objects.all().values_list("id", "contents", "number")),
+            [
+                (obj1.pk, "foo", 3),
+                (obj2.pk, "bar", 4),
+            ],
+        )
+
+
 class TestBulkDestroyCorrectness(TestCase):
     def setUp(self):
         super(TestBulkDestroyCorrectness, self).setUp()
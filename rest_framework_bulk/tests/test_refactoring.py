@@ -1,13 +1,18 @@
 from __future__ import print_function, unicode_literals
 
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
 from django.test.client import RequestFactory
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.serializers import ModelSerializer
 
 from rest_framework_bulk.serializers import BulkListSerializer, BulkSerializerMixin
 
 from .simple_app.models import SimpleModel
+from .simple_app.serializers import SimpleSerializer
 from .simple_app.views import SimpleBulkAPIView
 
 
@@ -105,19 +110,30 @@ class TestNonPKLookupField(TestCase):
 
 
 class TestPerformanceImprovements(TestCase):
-    def test_counter_performance(self):
+    def test_duplicate_detection(self):
         """
-        Test that duplicate detection uses Counter for O(n) performance.
+        Test that the single-pass set-based duplicate detection in
+        BulkListSerializer.update reports the duplicated ids.
         """
-        from collections import Counter
+        obj1 = SimpleModel.objects.create(contents="first", number=1)
+        obj2 = SimpleModel.objects.create(contents="second", number=2)
 
-        # Create a list with duplicates
-        test_list = [1, 2, 3, 2, 4, 5, 3, 6, 7, 8, 9, 10, 2]
+        serializer = SimpleSerializer(SimpleModel.objects.all(), many=True)
 
-        # O(n) approach using Counter
-        duplicates = [k for k, v in Counter(test_list).items() if v > 1]
+        with self.assertRaises(ValidationError) as ctx:
+            serializer.update(
+                SimpleModel.objects.all(),
+                [
+                    {"id": obj1.pk, "number": 10},
+                    {"id": obj2.pk, "number": 20},
+                    {"id": obj1.pk, "number": 30},
+                ],
+            )
 
-        self.assertEqual(sorted(duplicates), [2, 3])
+        self.assertIn(
+            f"Duplicate id values found in request: [{obj1.pk}]",
+            str(ctx.exception.detail),
+        )
 
     def test_in_bulk_usage(self):
         """
@@ -138,6 +154,100 @@ class TestPerformanceImprovements(TestCase):
         self.assertEqual(obj_dict[obj3.pk].contents, "third")
 
 
+class TestValuesUpdateStrategy(TestCase):
+    """
+    Test the UPDATE ... FROM (VALUES ...) SQL builder against a mocked
+    cursor; the strategy itself only runs on PostgreSQL.
+    """
+
+    def _bulk_update_values(self, queryset, objects, fields, batch_size=1000):
+        serializer = SimpleSerializer(SimpleModel.objects.all(), many=True)
+        with mock.patch.object(connection, "cursor") as cursor_factory:
+            cursor = cursor_factory.return_value.__enter__.return_value
+            serializer._bulk_update_values(queryset, objects, fields, "id", batch_size)
+        return cursor
+
+    def test_generated_sql_and_params(self):
+        """
+        Test the shape of the generated statement and the row-major
+        parameter ordering, including the write-time restriction mirroring
+        the queryset's filters.
+        """
+        obj1 = SimpleModel.objects.create(contents="first", number=1)
+        obj2 = SimpleModel.objects.create(contents="second", number=2)
+        obj1.number = 10
+        obj2.number = 20
+
+        queryset = SimpleModel.objects.filter(number__gte=0)
+        cursor = self._bulk_update_values(queryset, [obj1, obj2], ["number"])
+
+        self.assertEqual(cursor.execute.call_count, 1)
+        sql, params = cursor.execute.call_args.args
+
+        table = connection.ops.quote_name(SimpleModel._meta.db_table)
+        number_col = connection.ops.quote_name("number")
+        id_col = connection.ops.quote_name("id")
+
+        self.assertIn(f"UPDATE {table} SET {number_col} = data.{number_col}", sql)
+        self.assertIn(f"AS data ({id_col}, {number_col})", sql)
+        self.assertIn(f"WHERE {table}.{id_col} = data.{id_col}", sql)
+        # The first VALUES row carries type casts for the whole list
+        self.assertIn("%s::", sql)
+        # The queryset's own restriction is applied at write time too
+        self.assertIn(f"AND {table}.{id_col} IN (SELECT", sql)
+
+        # One (id, number) pair per object, then the restriction params
+        self.assertEqual(params, [obj1.pk, 10, obj2.pk, 20, 0])
+
+    def test_unrestricted_queryset_adds_no_where_subquery(self):
+        """
+        Test that an unfiltered queryset does not grow an IN subquery.
+        """
+        obj = SimpleModel.objects.create(contents="first", number=1)
+
+        cursor = self._bulk_update_values(SimpleModel.objects.all(), [obj], ["number"])
+
+        sql, params = cursor.execute.call_args.args
+        self.assertNotIn(" IN (", sql)
+        self.assertEqual(params, [obj.pk, 1])
+
+    def test_batching(self):
+        """
+        Test that rows are split into one statement per batch.
+        """
+        obj1 = SimpleModel.objects.create(contents="first", number=1)
+        obj2 = SimpleModel.objects.create(contents="second", number=2)
+
+        cursor = self._bulk_update_values(
+            SimpleModel.objects.all(), [obj1, obj2], ["number"], batch_size=1
+        )
+
+        self.assertEqual(cursor.execute.call_count, 2)
+        for call, obj in zip(cursor.execute.call_args_list, [obj1, obj2]):
+            sql, params = call.args
+            self.assertEqual(params, [obj.pk, obj.number])
+
+    def test_strategy_gating(self):
+        """
+        Test that the VALUES strategy only engages on PostgreSQL, with a
+        uniform field set, and when not disabled via bulk_update_strategy.
+        """
+        serializer = SimpleSerializer(SimpleModel.objects.all(), many=True)
+        queryset = SimpleModel.objects.all()
+        uniform = {1: {"id": 1, "number": 10}, 2: {"id": 2, "number": 20}}
+        ragged = {1: {"id": 1, "number": 10}, 2: {"id": 2, "number": 20, "contents": "x"}}
+
+        # The test database is SQLite, so the strategy must stay off
+        self.assertFalse(serializer._use_values_update(queryset, uniform, ["number"]))
+
+        with mock.patch.object(connection, "vendor", "postgresql"):
+            self.assertTrue(serializer._use_values_update(queryset, uniform, ["number"]))
+            self.assertFalse(serializer._use_values_update(queryset, ragged, ["number"]))
+
+            serializer.bulk_update_strategy = "django"
+            self.assertFalse(serializer._use_values_update(queryset, uniform, ["number"]))
+
+
 class TestTransactionMixin(TestCase):
     def test_transaction_mixin_inheritance(self):
         """